@@ -26,9 +26,14 @@ ENDPOINT="viper.verinexus.com:51820"
 ALLOWED_IPS="172.31.0.1/32"
 PERSISTENT_KEEPALIVE="25"
 
+# Interface details, read once by load_link_info and reused by later checks
+LINK_INFO=""
+
 log_message() {
     # Function for logging messages with timestamps
-    echo -e "${YELLOW}[$(date '+%Y-%m-%d %H:%M:%S')] $1${RESET}"
+    local timestamp
+    printf -v timestamp '%(%Y-%m-%d %H:%M:%S)T' -1
+    echo -e "${YELLOW}[$timestamp] $1${RESET}"
 }
 
 error_message() {
@@ -41,10 +46,15 @@ success_message() {
     echo -e "${GREEN}SUCCESS: $1${RESET}"
 }
 
+# Function to read interface details once
+load_link_info() {
+    LINK_INFO=$(ip link show)
+}
+
 # Function to validate target MAC address
 check_mac_address() {
     log_message "Checking for target MAC address ($TARGET_MAC)..."
-    if ! ip link | grep -iq "$TARGET_MAC"; then
+    if ! grep -iq "$TARGET_MAC" <<< "$LINK_INFO"; then
         error_message "Target MAC address not found. Exiting script."
         return 1
     fi
@@ -73,7 +83,8 @@ install_wireguard() {
 # Function to create WireGuard configuration
 create_wireguard_config() {
     log_message "Creating WireGuard configuration file ($WG_CONF)..."
-    sudo bash -c "cat > $WG_CONF" <<EOF
+    local config
+    config=$(cat <<EOF
 [Interface]
 PrivateKey = $PRIVATE_KEY
 Address = $ADDRESS
@@ -84,12 +95,19 @@ Endpoint = $ENDPOINT
 AllowedIPs = $ALLOWED_IPS
 PersistentKeepalive = $PERSISTENT_KEEPALIVE
 EOF
+)
 
-    if [ $? -eq 0 ]; then
-        success_message "WireGuard configuration file created."
+    # Skip the write when the existing file already matches
+    if sudo cmp -s "$WG_CONF" - <<< "$config"; then
+        success_message "WireGuard configuration file is already up to date."
     else
-        error_message "Failed to create WireGuard configuration file."
-        return 1
+        sudo bash -c "cat > $WG_CONF" <<< "$config"
+        if [ $? -eq 0 ]; then
+            success_message "WireGuard configuration file created."
+        else
+            error_message "Failed to create WireGuard configuration file."
+            return 1
+        fi
     fi
 
     sudo chmod 600 $WG_CONF
@@ -100,7 +118,7 @@ EOF
 # Function to enable and start WireGuard service
 start_wireguard_service() {
     log_message "Starting and enabling WireGuard service ($WG_SERVICE)..."
-    sudo systemctl enable $WG_SERVICE && sudo systemctl start $WG_SERVICE
+    sudo systemctl enable --now $WG_SERVICE
 
     if [ $? -eq 0 ]; then
         success_message "WireGuard service started and enabled."
@@ -114,7 +132,7 @@ start_wireguard_service() {
 # Function to log network information
 log_network_info() {
     log_message "Logging network information..."
-    MAC_ADDR=$(ip link show | grep -E 'link/ether' | awk '{print $2}' | head -n 1)
+    MAC_ADDR=$(awk '/link\/ether/ {print $2; exit}' <<< "$LINK_INFO")
     EXTERNAL_IP=$(curl -s https://api.ipify.org)
     log_message "Device MAC Address: $MAC_ADDR"
     log_message "External IP Address: $EXTERNAL_IP"
@@ -126,6 +144,7 @@ main() {
     log_message "Starting WireGuard setup script..."
     
     # Validate MAC address
+    load_link_info
     check_mac_address || exit 0
 
     # Install WireGuard if needed